@@ -10,13 +10,29 @@ Sentry.init({
 	replaysOnErrorSampleRate: 1.0,
 	replaysSessionSampleRate: 0,
 
-	integrations: [
-		Sentry.replayIntegration({
-			// Mask all text and block all media by default for privacy
-			maskAllText: true,
-			blockAllMedia: true
-		})
-	],
-
 	environment: import.meta.env.MODE
 });
+
+// Replay is the largest part of the Sentry client. Load it from the CDN once the page
+// has finished loading so it stays out of the main bundle and off the critical path.
+function loadReplay(): void {
+	Sentry.lazyLoadIntegration('replayIntegration')
+		.then((replayIntegration) => {
+			Sentry.addIntegration(
+				replayIntegration({
+					// Mask all text and block all media by default for privacy
+					maskAllText: true,
+					blockAllMedia: true
+				})
+			);
+		})
+		.catch((e) => {
+			console.error('Failed to load Sentry replay integration:', e);
+		});
+}
+
+if (document.readyState === 'complete') {
+	loadReplay();
+} else {
+	window.addEventListener('load', loadReplay, { once: true });
+}
@@ -1,6 +1,6 @@
 import { Chart, type Plugin } from 'chart.js';
 import { TOO_WARM_TEMP_C } from '$lib/config';
-import type { Reading } from '$lib/sensor';
+import type { ReadingSeries } from '$lib/sensor';
 
 // --- Named color constants ---
 const TEMPERATURE_BORDER = 'rgb(255, 159, 64)';
@@ -36,24 +36,77 @@ const temperatureAnnotationPlugin: Plugin = {
 	}
 };
 
-// --- Public factory functions ---
+// --- Label formatting ---
+
+// Locale formatting is the most expensive per-point step when (re)building a
+// chart, and the same timestamps are formatted again on every filter change.
+// Cache results per layout; the cache is cleared once it grows past the limit.
+const LABEL_CACHE_LIMIT = 65536;
+
+// toLocaleString() builds a fresh Intl formatter on every call; construct the
+// two formatters once and reuse them. Options match the toLocale* defaults.
+const desktopFormat = new Intl.DateTimeFormat(undefined, {
+	year: 'numeric',
+	month: 'numeric',
+	day: 'numeric',
+	hour: 'numeric',
+	minute: 'numeric',
+	second: 'numeric'
+});
+const mobileFormat = new Intl.DateTimeFormat(undefined, { hour: '2-digit', minute: '2-digit' });
 
-function formatLabel(timestamp: number, isMobile: boolean): string {
-	const date = new Date(timestamp);
-	if (isMobile) {
-		return date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+const desktopLabels = new Map<number, string>();
+const mobileLabels = new Map<number, string>();
+
+export function formatLabel(timestamp: number, isMobile: boolean): string {
+	const cache = isMobile ? mobileLabels : desktopLabels;
+	let label = cache.get(timestamp);
+	if (label === undefined) {
+		// Timestamps are already epoch milliseconds, which format() accepts directly.
+		label = (isMobile ? mobileFormat : desktopFormat).format(timestamp);
+		if (cache.size >= LABEL_CACHE_LIMIT) cache.clear();
+		cache.set(timestamp, label);
 	}
-	return date.toLocaleString();
+	return label;
 }
 
-export function createTemperatureChart(canvas: HTMLCanvasElement, readings: Reading[], isMobile: boolean = false): Chart {
-	const labels = readings.map((r) => formatLabel(r.timestamp, isMobile));
-	const tempData = readings.map((r) => r.temperature);
+/** Format every timestamp once; both charts share the result. */
+export function formatLabels(timestamps: number[], isMobile: boolean): string[] {
+	return timestamps.map((t) => formatLabel(t, isMobile));
+}
+
+// --- Shared options ---
+
+// Built once and spread into each chart. Chart.js writes resolved plugins/scales
+// onto the options object it is given, so the per-chart object must stay fresh.
+const BASE_OPTIONS = {
+	responsive: true,
+	maintainAspectRatio: false,
+	// Readings are sorted and unique (the page drops replayed live readings), and
+	// lines are redrawn on every new reading: skip animations and let Chart.js take
+	// its sorted-data fast paths.
+	animation: false,
+	normalized: true
+} as const;
+
+const DESKTOP_X_AXIS = { ticks: { maxTicksLimit: 8, font: { size: 12 } } };
+const MOBILE_X_AXIS = { ticks: { maxTicksLimit: 4, font: { size: 10 } } };
+
+// --- Public factory functions ---
+
+export function createTemperatureChart(
+	canvas: HTMLCanvasElement,
+	series: ReadingSeries,
+	labels: string[],
+	isMobile: boolean = false
+): Chart {
+	// Copy: live updates push/shift the dataset in place and must not touch page data.
+	const tempData = series.temperatures.slice();
 
 	return new Chart(canvas, {
 		type: 'line',
 		data: {
-			labels,
+			labels: labels.slice(),
 			datasets: [
 				{
 					label: 'Temperature (°C)',
@@ -66,18 +119,12 @@ export function createTemperatureChart(canvas: HTMLCanvasElement, readings: Read
 			]
 		},
 		options: {
-			responsive: true,
-			maintainAspectRatio: false,
+			...BASE_OPTIONS,
 			plugins: {
 				legend: { display: !isMobile }
 			},
 			scales: {
-				x: {
-					ticks: {
-						maxTicksLimit: isMobile ? 4 : 8,
-						font: { size: isMobile ? 10 : 12 }
-					}
-				},
+				x: isMobile ? MOBILE_X_AXIS : DESKTOP_X_AXIS,
 				y: {
 					ticks: {
 						font: { size: isMobile ? 10 : 12 }
@@ -89,14 +136,18 @@ export function createTemperatureChart(canvas: HTMLCanvasElement, readings: Read
 	});
 }
 
-export function createHumidityChart(canvas: HTMLCanvasElement, readings: Reading[], isMobile: boolean = false): Chart {
-	const labels = readings.map((r) => formatLabel(r.timestamp, isMobile));
-	const humidData = readings.map((r) => r.humidity);
+export function createHumidityChart(
+	canvas: HTMLCanvasElement,
+	series: ReadingSeries,
+	labels: string[],
+	isMobile: boolean = false
+): Chart {
+	const humidData = series.humidities.slice();
 
 	return new Chart(canvas, {
 		type: 'line',
 		data: {
-			labels,
+			labels: labels.slice(),
 			datasets: [
 				{
 					label: 'Humidity (%)',
@@ -109,16 +160,10 @@ export function createHumidityChart(canvas: HTMLCanvasElement, readings: Reading
 			]
 		},
 		options: {
-			responsive: true,
-			maintainAspectRatio: false,
+			...BASE_OPTIONS,
 			scales: {
 				y: { min: 0, max: 100 },
-				x: {
-					ticks: {
-						maxTicksLimit: isMobile ? 4 : 8,
-						font: { size: isMobile ? 10 : 12 }
-					}
-				}
+				x: isMobile ? MOBILE_X_AXIS : DESKTOP_X_AXIS
 			},
 			plugins: {
 				legend: { display: !isMobile }
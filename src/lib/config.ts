@@ -13,3 +13,18 @@ export const CUTOFF_DATE = '2026-02-16';
  * is critical for food safety and preservation.
  */
 export const TOO_WARM_TEMP_C = 15;
+
+/**
+ * Maximum number of readings a chart holds. The initial payload is downsampled
+ * to this with LTTB and live updates prune the oldest readings beyond it; a chart
+ * a few thousand pixels wide cannot show more detail than this anyway.
+ */
+export const MAX_CHART_POINTS = 2000;
+
+/**
+ * How long the CDN may serve a dashboard data response (`__data.json`) before
+ * reloading it; with stale-while-revalidate a response can be up to twice this old.
+ * Staleness is harmless because the page reopens its SSE stream from the newest
+ * reading in each data response it applies, so anything newer is streamed back in.
+ */
+export const PAGE_CACHE_SECONDS = 30;
@@ -0,0 +1,115 @@
+import { takeSeries } from '$lib/utils';
+import type { ReadingSeries } from '$lib/types';
+
+/**
+ * Pick the indices to keep for one series using Largest-Triangle-Three-Buckets.
+ * The first and last points are always kept. Within a bucket, rows flagged in
+ * `complete` win over other numeric rows, and a null is kept only when the bucket
+ * holds nothing else, so real gaps survive and no spurious ones are introduced.
+ * @param xs - Timestamps sorted ascending
+ * @param ys - Values sharing an index with `xs`
+ * @param complete - 1 where every column of the row is numeric, 0 otherwise
+ * @param threshold - Number of points to keep (at least 3)
+ * @returns Sorted indices into `xs`
+ */
+function lttbIndices(
+	xs: number[],
+	ys: (number | null)[],
+	complete: Uint8Array,
+	threshold: number
+): number[] {
+	const n = xs.length;
+	const indices: number[] = [0];
+	const bucketSize = (n - 2) / (threshold - 2);
+	let a = 0;
+
+	for (let i = 0; i < threshold - 2; i++) {
+		// Coordinates are taken relative to the previously selected point `a`.
+		// Third triangle vertex: the average of the next bucket.
+		const nextStart = Math.floor((i + 1) * bucketSize) + 1;
+		const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n);
+		const ax = xs[a];
+		const ay = ys[a];
+		let avgX = 0;
+		let avgY = 0;
+		let count = 0;
+		for (let j = nextStart; j < nextEnd; j++) {
+			const y = ys[j];
+			if (y === null) continue;
+			avgX += xs[j] - ax;
+			avgY += y;
+			count++;
+		}
+		avgX /= count;
+		avgY /= count;
+
+		// Keep the point in this bucket that forms the largest triangle, preferring
+		// complete rows so a pick never punches a gap into the other column. Without a
+		// triangle (previous pick or next bucket is all null) keep the first candidate.
+		const start = Math.floor(i * bucketSize) + 1;
+		const end = Math.floor((i + 1) * bucketSize) + 1;
+		const hasTriangle = ay !== null && count > 0;
+		let selected = -1;
+		let selectedComplete = false;
+		let maxArea = -1;
+		for (let j = start; j < end; j++) {
+			const y = ys[j];
+			if (y === null) continue;
+			const isComplete = complete[j] === 1;
+			if (selectedComplete && !isComplete) continue;
+			const area = hasTriangle ? Math.abs((xs[j] - ax) * (avgY - ay) - avgX * (y - ay)) : 0;
+			if (selected === -1 || (isComplete && !selectedComplete) || area > maxArea) {
+				selected = j;
+				selectedComplete = isComplete;
+				maxArea = area;
+			}
+		}
+		// Only nulls in this bucket: keep one so the gap survives.
+		if (selected === -1) selected = start;
+		indices.push(selected);
+		a = selected;
+	}
+
+	indices.push(n - 1);
+	return indices;
+}
+
+/** Merge two sorted index lists, dropping duplicates. */
+function mergeIndices(left: number[], right: number[]): number[] {
+	const merged: number[] = [];
+	let i = 0;
+	let j = 0;
+	while (i < left.length || j < right.length) {
+		const takeLeft = j >= right.length || (i < left.length && left[i] <= right[j]);
+		const next = takeLeft ? left[i++] : right[j++];
+		if (merged.length === 0 || merged[merged.length - 1] !== next) merged.push(next);
+	}
+	return merged;
+}
+
+/**
+ * Downsample a series for plotting while preserving the visual shape of both columns.
+ * Temperature and humidity are sampled independently with LTTB and the union of
+ * the selected rows is kept, so neither column loses its peaks. Both passes prefer
+ * rows where both columns are numeric, so a row picked for one column does not
+ * bring a spurious null into the other.
+ * @param series - Columns sorted by timestamp ascending
+ * @param maxPoints - Upper bound on the number of rows returned
+ * @returns The input unchanged if it is already small enough, otherwise a subset
+ */
+export function downsampleSeries(series: ReadingSeries, maxPoints: number): ReadingSeries {
+	const perSeries = Math.floor(maxPoints / 2);
+	if (series.timestamps.length <= maxPoints || perSeries < 3) return series;
+
+	const { timestamps, temperatures, humidities } = series;
+	const complete = new Uint8Array(timestamps.length);
+	for (let i = 0; i < complete.length; i++) {
+		complete[i] = temperatures[i] !== null && humidities[i] !== null ? 1 : 0;
+	}
+
+	const indices = mergeIndices(
+		lttbIndices(timestamps, temperatures, complete, perSeries),
+		lttbIndices(timestamps, humidities, complete, perSeries)
+	);
+	return takeSeries(series, indices);
+}
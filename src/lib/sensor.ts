@@ -1,47 +1,105 @@
 import { initFirebase } from '$lib/firebase';
 import { DB_REF_PATH, CUTOFF_DATE } from '$lib/config';
 import logger from '$lib/logger';
-import { parseTimestampSeconds, parseNumeric } from '$lib/utils';
-import type { Reading, FirebaseReading } from '$lib/types';
+import { parseTimestampSeconds, parseNumeric, takeSeries } from '$lib/utils';
+import type { ReadingSeries, FirebaseReading } from '$lib/types';
 
-export type { Reading } from '$lib/types';
+export type { Reading, ReadingSeries } from '$lib/types';
 
-export async function loadSensorData(): Promise<Reading[]> {
+// CUTOFF_DATE is a constant, so parse it once at module load rather than per request.
+const cutoffDateSeconds = Math.floor(new Date(CUTOFF_DATE).getTime() / 1000);
+
+// Rolling windows ('1h', '1d') start at Date.now(), which changes every second. Their
+// lower bound is rounded down to this granularity so requests within the same minute
+// issue the same query; callers trim to their exact window afterwards.
+const QUERY_BUCKET_SECONDS = 60;
+
+// Queries currently in flight, keyed by their (rounded) lower bound. Concurrent page
+// loads for the same filter share one Firebase round trip instead of each issuing their own.
+const pendingQueries = new Map<number, Promise<ReadingSeries>>();
+
+/**
+ * Load readings from Firebase as columns, sorted by timestamp ascending.
+ * The returned series is shared between concurrent callers and must not be mutated.
+ * @param sinceSeconds - Optional lower bound, rounded down to the minute; readings after
+ *   the rounded bound are fetched, so callers needing an exact window must trim the
+ *   result. The query never reaches further back than CUTOFF_DATE.
+ */
+export function loadSensorData(sinceSeconds?: number): Promise<ReadingSeries> {
+	// Filter on the server so only the requested window is downloaded.
+	const bucketedSeconds =
+		sinceSeconds === undefined
+			? 0
+			: Math.floor(sinceSeconds / QUERY_BUCKET_SECONDS) * QUERY_BUCKET_SECONDS;
+	const startAfterSeconds = Math.max(cutoffDateSeconds, bucketedSeconds);
+
+	const pending = pendingQueries.get(startAfterSeconds);
+	if (pending) {
+		logger.debug({ startAfterSeconds }, 'Reusing in-flight sensor data query');
+		return pending;
+	}
+
+	const query = querySensorData(startAfterSeconds).finally(() => {
+		pendingQueries.delete(startAfterSeconds);
+	});
+	pendingQueries.set(startAfterSeconds, query);
+	return query;
+}
+
+async function querySensorData(startAfterSeconds: number): Promise<ReadingSeries> {
 	logger.info('Loading sensor data from Firebase');
 	const { database } = await initFirebase();
 
-	const cutoffDateSeconds = Math.floor(new Date(CUTOFF_DATE).getTime() / 1000);
 	logger.debug(
-		{ path: DB_REF_PATH, cutoffDate: CUTOFF_DATE, cutoffDateSeconds },
+		{ path: DB_REF_PATH, cutoffDate: CUTOFF_DATE, cutoffDateSeconds, startAfterSeconds },
 		'Querying sensor data'
 	);
-	const ref = database.ref(DB_REF_PATH).orderByChild('timestamp').startAfter(cutoffDateSeconds);
+	const ref = database.ref(DB_REF_PATH).orderByChild('timestamp').startAfter(startAfterSeconds);
 	const snapshot = await ref.once('value');
-	const raw = snapshot.val();
 
-	if (!raw) {
+	if (!snapshot.exists()) {
 		logger.info('No sensor data found after cutoff date');
-		return [];
+		return { timestamps: [], temperatures: [], humidities: [] };
+	}
+
+	// Walk the children one at a time rather than materializing the whole subtree
+	// with snapshot.val(), extracting only the fields we keep into flat columns.
+	const timestamps: number[] = [];
+	const temperatures: (number | null)[] = [];
+	const humidities: (number | null)[] = [];
+	let sorted = true;
+	snapshot.forEach((child) => {
+		const entry: unknown = child.val();
+		if (typeof entry !== 'object' || entry === null) return;
+		const typedEntry = entry as FirebaseReading;
+		const timestamp = parseTimestampSeconds(typedEntry.timestamp);
+		if (timestamp === null) return;
+		if (timestamps.length > 0 && timestamp < timestamps[timestamps.length - 1]) sorted = false;
+		timestamps.push(timestamp);
+		temperatures.push(parseNumeric(typedEntry.temperature));
+		humidities.push(parseNumeric(typedEntry.humidity));
+	});
+
+	// forEach visits children in query (timestamp) order, so the columns are normally
+	// already sorted. Timestamps stored as strings order after numbers in Firebase;
+	// if any turn up, sort an index over the timestamps and permute every column.
+	const n = timestamps.length;
+	let series: ReadingSeries = { timestamps, temperatures, humidities };
+	if (!sorted) {
+		const order = new Uint32Array(n);
+		for (let i = 0; i < n; i++) order[i] = i;
+		order.sort((a, b) => timestamps[a] - timestamps[b]);
+		series = takeSeries(series, order);
 	}
 
-	const readings: Reading[] = Object.entries(raw as Record<string, unknown>)
-		.filter(([, entry]) => typeof entry === 'object' && entry !== null)
-		.flatMap(([key, entry]) => {
-			const typedEntry = entry as FirebaseReading;
-			const timestamp = parseTimestampSeconds(typedEntry.timestamp);
-			if (timestamp === null) return [];
-			return [
-				{
-					key,
-					timestamp,
-					temperature: parseNumeric(typedEntry.temperature),
-					humidity: parseNumeric(typedEntry.humidity)
-				}
-			];
-		});
-
-	readings.sort((a, b) => a.timestamp - b.timestamp);
-
-	logger.info({ count: readings.length }, 'Sensor data loaded successfully');
-	return readings;
+	// One summary line for the whole load instead of anything per reading.
+	logger.info(
+		{
+			count: n,
+			first: n > 0 ? series.timestamps[0] : null,
+			last: n > 0 ? series.timestamps[n - 1] : null
+		},
+		'Sensor data loaded successfully'
+	);
+	return series;
 }
@@ -9,7 +9,7 @@ export interface FirebaseReading {
 }
 
 /**
- * Client-facing reading with validated data and key.
+ * A single validated reading, as streamed to the client over SSE.
  */
 export interface Reading {
 	key: string;
@@ -17,3 +17,13 @@ export interface Reading {
 	temperature: number | null;
 	humidity: number | null;
 }
+
+/**
+ * Column-oriented readings for bulk transfer and charting.
+ * All arrays share an index and are sorted by timestamp ascending.
+ */
+export interface ReadingSeries {
+	timestamps: number[];
+	temperatures: (number | null)[];
+	humidities: (number | null)[];
+}
@@ -1,12 +1,18 @@
+import type { ReadingSeries } from '$lib/types';
+
+/** 2000-01-01T00:00:00Z in epoch seconds. Anything earlier is an unsynced device clock. */
+const MIN_VALID_TIMESTAMP_SECONDS = 946684800;
+
 /**
  * Parse a timestamp in seconds and convert to milliseconds.
  * @param timestampSeconds - Value that may be a number or numeric string
- * @returns Millisecond timestamp, or null if the input cannot be parsed
+ * @returns Millisecond timestamp, or null if the input cannot be parsed or is before 2000
  */
 export function parseTimestampSeconds(timestampSeconds: unknown): number | null {
 	const num =
 		typeof timestampSeconds === 'number' ? timestampSeconds : parseFloat(String(timestampSeconds));
-	if (isNaN(num)) return null;
+	// A single numeric compare; NaN fails it too, so no separate NaN check is needed.
+	if (!(num >= MIN_VALID_TIMESTAMP_SECONDS)) return null;
 	return num * 1000;
 }
 
@@ -19,6 +25,48 @@ export function parseNumeric(value: unknown): number | null {
 	return typeof value === 'number' && isFinite(value) ? value : null;
 }
 
+/**
+ * Binary search a list of numbers sorted ascending.
+ * @param values - Numbers sorted ascending
+ * @param target - Value to search for
+ * @returns Index of the first value strictly greater than `target`
+ */
+export function upperBound(values: number[], target: number): number {
+	let lo = 0;
+	let hi = values.length;
+	while (lo < hi) {
+		const mid = (lo + hi) >>> 1;
+		if (values[mid] <= target) {
+			lo = mid + 1;
+		} else {
+			hi = mid;
+		}
+	}
+	return lo;
+}
+
+/**
+ * Select rows from every column of a series.
+ * @param series - Source columns
+ * @param indices - Row indices to keep, in output order
+ * @returns A new series; the source is not modified
+ */
+export function takeSeries(series: ReadingSeries, indices: ArrayLike<number>): ReadingSeries {
+	const n = indices.length;
+	const result: ReadingSeries = {
+		timestamps: new Array(n),
+		temperatures: new Array(n),
+		humidities: new Array(n)
+	};
+	for (let i = 0; i < n; i++) {
+		const j = indices[i];
+		result.timestamps[i] = series.timestamps[j];
+		result.temperatures[i] = series.temperatures[j];
+		result.humidities[i] = series.humidities[j];
+	}
+	return result;
+}
+
 /**
  * Validate that an environment variable exists and is non-empty.
  * @param name - Environment variable name
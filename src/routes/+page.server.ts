@@ -1,29 +1,65 @@
 import { error } from '@sveltejs/kit';
 import * as Sentry from '@sentry/sveltekit';
 import { loadSensorData } from '$lib/sensor';
+import { downsampleSeries } from '$lib/downsample';
+import { MAX_CHART_POINTS, PAGE_CACHE_SECONDS } from '$lib/config';
 import logger from '$lib/logger';
+import { upperBound } from '$lib/utils';
 import type { PageServerLoad } from './$types';
-import type { Reading } from '$lib/types';
+import type { ReadingSeries } from '$lib/types';
 
-type TimeFilter = 'all' | '1h' | '1d';
+const TIME_FILTERS = ['all', '1h', '1d'] as const;
+type TimeFilter = (typeof TIME_FILTERS)[number];
 
-function filterReadings(readings: Reading[], filter: TimeFilter): Reading[] {
-	if (filter === 'all') return readings;
+/** Read the filter from the query string, falling back to 'all' for unknown values. */
+function parseFilter(value: string | null): TimeFilter {
+	return TIME_FILTERS.find((filter) => filter === value) ?? 'all';
+}
+
+/** Millisecond timestamp where the filter window starts, or null for no window. */
+function windowStartMs(filter: TimeFilter): number | null {
+	if (filter === 'all') return null;
 
-	const now = Date.now();
 	const filterMs = filter === '1h' ? 1000 * 60 * 60 : 1000 * 60 * 60 * 24;
+	return Date.now() - filterMs;
+}
+
+function filterSeries(series: ReadingSeries, startMs: number | null): ReadingSeries {
+	if (startMs === null) return series;
 
-	return readings.filter((reading) => now - reading.timestamp < filterMs);
+	// Readings are sorted ascending, so the window is a suffix: find where it
+	// starts with a binary search instead of testing every reading.
+	const start = upperBound(series.timestamps, startMs);
+	if (start === 0) return series;
+	return {
+		timestamps: series.timestamps.slice(start),
+		temperatures: series.temperatures.slice(start),
+		humidities: series.humidities.slice(start)
+	};
 }
 
-export const load: PageServerLoad = async ({ url }) => {
+export const load: PageServerLoad = async ({ url, setHeaders, isDataRequest }) => {
 	try {
 		logger.info('Loading page data');
-		const rawReadings = await loadSensorData();
-		const filter = (url.searchParams.get('filter') ?? 'all') as TimeFilter;
-		const readings = filterReadings(rawReadings, filter);
-		logger.info('Page data loaded successfully');
-		return { readings, filter };
+		const rawFilter = url.searchParams.get('filter');
+		const filter = parseFilter(rawFilter);
+		const startMs = windowStartMs(filter);
+		// The query bound is rounded down to the minute, so trim to the exact window after.
+		const rawSeries = await loadSensorData(
+			startMs === null ? undefined : Math.floor(startMs / 1000)
+		);
+		const series = downsampleSeries(filterSeries(rawSeries, startMs), MAX_CHART_POINTS);
+		logger.info({ count: series.timestamps.length }, 'Page data loaded successfully');
+		// Let the CDN reuse the chart payload across visitors instead of querying Firebase
+		// for every filter navigation. Only the data response is cacheable: the rendered
+		// HTML carries this request's Sentry trace meta tags and must stay per-request.
+		// The CDN keys on the URL, so unknown filter values are served but never cached.
+		if (isDataRequest && (rawFilter === null || rawFilter === filter)) {
+			setHeaders({
+				'cache-control': `public, max-age=0, s-maxage=${PAGE_CACHE_SECONDS}, stale-while-revalidate=${PAGE_CACHE_SECONDS}`
+			});
+		}
+		return { series, filter };
 	} catch (e) {
 		const message = e instanceof Error ? e.message : 'Unknown error loading sensor data';
 		const details = e instanceof Error ? e.stack : String(e);
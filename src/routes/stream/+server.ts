@@ -5,6 +5,9 @@ import { parseTimestampSeconds, parseNumeric } from '$lib/utils';
 import type { DataSnapshot } from 'firebase-admin/database';
 import type { RequestHandler } from './$types';
 
+// Shared across connections; encoding is stateless so one instance serves every event.
+const encoder = new TextEncoder();
+
 export const GET: RequestHandler = async ({ url }) => {
 	// Read the `since` query param (milliseconds from the client).
 	// Fall back to 0 if absent, and validate it is non-negative and reasonable.
@@ -71,7 +74,7 @@ export const GET: RequestHandler = async ({ url }) => {
 
 						// Format as SSE. Each event must end with \n\n.
 						const payload = `data: ${JSON.stringify(reading)}\n\n`;
-						controller.enqueue(new TextEncoder().encode(payload));
+						controller.enqueue(encoder.encode(payload));
 					} catch (e) {
 						logger.error(e, 'Error processing sensor reading');
 						Sentry.captureException(e);